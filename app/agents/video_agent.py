@@ -15,6 +15,7 @@ from __future__ import annotations
 import json
 import logging
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
 
 from app.agents.base import BaseAgent
@@ -39,6 +40,12 @@ _SUMMARY_PATH = Path(__file__).resolve().parent.parent / "summarizer" / "summary
 _DEMO_ASSETS = Path(__file__).resolve().parent.parent.parent / "demo_assets"
 
 
+@lru_cache(maxsize=8)
+def _read_summary(path: str, mtime_ns: int) -> str:
+    """Read and strip summary.txt; keyed on mtime so a regenerated summary is picked up."""
+    return Path(path).read_text().strip()
+
+
 def _build_zones_from_summary(text: str) -> list[ZoneAnalysis]:
     """Map the Pegasus narrative into structured zone data for safety/productivity agents.
 
@@ -202,7 +209,7 @@ class VideoAgent(BaseAgent):
         else:
             # Read cached Pegasus summary
             if _SUMMARY_PATH.is_file():
-                analysis_text = _SUMMARY_PATH.read_text().strip()
+                analysis_text = _read_summary(str(_SUMMARY_PATH), _SUMMARY_PATH.stat().st_mtime_ns)
                 logger.info("Loaded cached Pegasus summary: %d chars from %s", len(analysis_text), _SUMMARY_PATH)
             else:
                 analysis_text = "No Pegasus summary available. Run: python app/summarizer/summary.py --video <path>"
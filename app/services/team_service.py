@@ -30,6 +30,10 @@ TEAMS_FILE = DATA_DIR / "teams.json"
 SITE_WORKERS: dict[str, SiteWorker] = {}
 TEAMS: dict[str, Team] = {}
 
+# Secondary index: site_id → {worker_id → SiteWorker}. Only mutated through the
+# worker helpers below so it stays in step with SITE_WORKERS.
+_workers_by_site: dict[str, dict[str, SiteWorker]] = {}
+
 # ── JSON helpers ──────────────────────────────────────────────────────────────
 
 def _save_workers() -> None:
@@ -50,8 +54,7 @@ def _load_workers() -> bool:
         return False
     with open(WORKERS_FILE, encoding="utf-8") as f:
         for item in json.load(f):
-            w = SiteWorker(**item)
-            SITE_WORKERS[w.id] = w
+            _put_worker(SiteWorker(**item))
     return True
 
 
@@ -64,6 +67,11 @@ def _load_teams() -> None:
             TEAMS[t.id] = t
 
 
+def _put_worker(worker: SiteWorker) -> None:
+    SITE_WORKERS[worker.id] = worker
+    _workers_by_site.setdefault(worker.site_id, {})[worker.id] = worker
+
+
 # ── Default worker roster (used only on first run) ────────────────────────────
 
 _DEFAULT_WORKERS = [
@@ -125,7 +133,7 @@ def initialize() -> None:
     DATA_DIR.mkdir(parents=True, exist_ok=True)
     if not _load_workers():
         for wid, name, trade, site_id in _DEFAULT_WORKERS:
-            SITE_WORKERS[wid] = SiteWorker(id=wid, name=name, trade=trade, site_id=site_id)
+            _put_worker(SiteWorker(id=wid, name=name, trade=trade, site_id=site_id))
         _save_workers()
     _load_teams()
 
@@ -133,23 +141,26 @@ def initialize() -> None:
 # ── Worker CRUD ───────────────────────────────────────────────────────────────
 
 def get_site_workers(site_id: str) -> list[SiteWorker]:
-    return [w for w in SITE_WORKERS.values() if w.site_id == site_id]
+    return list(_workers_by_site.get(site_id, {}).values())
 
 
 def add_worker(name: str, trade: str, site_id: str) -> SiteWorker:
     # Generate a sequential-style id based on site + current count
-    site_count = sum(1 for w in SITE_WORKERS.values() if w.site_id == site_id)
+    site_count = len(_workers_by_site.get(site_id, {}))
     wid = f"w_{site_id}_{site_count + 1:02d}_{uuid.uuid4().hex[:4]}"
     worker = SiteWorker(id=wid, name=name, trade=trade, site_id=site_id)
-    SITE_WORKERS[wid] = worker
+    _put_worker(worker)
     _save_workers()
     return worker
 
 
 def remove_worker(worker_id: str) -> bool:
-    if worker_id not in SITE_WORKERS:
+    worker = SITE_WORKERS.pop(worker_id, None)
+    if worker is None:
         return False
-    del SITE_WORKERS[worker_id]
+    site_workers = _workers_by_site.get(worker.site_id)
+    if site_workers is not None:
+        site_workers.pop(worker_id, None)
     # Also remove from any teams that reference this worker
     for team in TEAMS.values():
         if worker_id in team.worker_ids:
@@ -270,7 +281,7 @@ async def auto_assign_workers(site_id: str, date: str, team_id: str | None = Non
     """
     from app.agents.team_planner_agent import TeamPlannerAgent
 
-    all_workers = {w.id: w for w in get_site_workers(site_id)}
+    all_workers = _workers_by_site.get(site_id, {})  # already keyed by worker id
     today_teams = get_teams(site_id, date)
     assigned_ids = {wid for t in today_teams for wid in t.worker_ids}
     unassigned = [w for w in all_workers.values() if w.id not in assigned_ids]
@@ -338,13 +349,13 @@ async def auto_assign_workers(site_id: str, date: str, team_id: str | None = Non
         # Target ~2+ workers per team; spread workers across teams
         assignments: list[dict] = []
         assigned_wids: set[str] = set()
+        team_counts: dict[str, int] = {t["id"]: 0 for t in team_contexts}
         workers_per_team = max(2, len(worker_contexts) // max(1, len(team_contexts)))
         for t in team_contexts:
-            count = 0
             for w in worker_contexts:
                 if w["id"] in assigned_wids:
                     continue
-                if count >= workers_per_team:
+                if team_counts[t["id"]] >= workers_per_team:
                     break
                 if not t["assigned_trades"] or w["trade"] in t["assigned_trades"]:
                     assignments.append({
@@ -353,20 +364,20 @@ async def auto_assign_workers(site_id: str, date: str, team_id: str | None = Non
                         "reason": "Trade match (AI unavailable)",
                     })
                     assigned_wids.add(w["id"])
-                    count += 1
+                    team_counts[t["id"]] += 1
         # Assign any remaining workers to teams that are under target
         for w in worker_contexts:
             if w["id"] in assigned_wids:
                 continue
             for t in team_contexts:
-                current = sum(1 for a in assignments if a["team_id"] == t["id"])
-                if current < workers_per_team:
+                if team_counts[t["id"]] < workers_per_team:
                     assignments.append({
                         "worker_id": w["id"], "worker_name": w["name"],
                         "team_id": t["id"], "team_name": t["name"],
                         "reason": "Trade match (AI unavailable)",
                     })
                     assigned_wids.add(w["id"])
+                    team_counts[t["id"]] += 1
                     break
         return {
             "assignments": assignments,
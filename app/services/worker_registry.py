@@ -1,15 +1,30 @@
 """In-memory worker registry. Workers register on headset startup."""
 from __future__ import annotations
 
-from datetime import datetime, timezone
+import asyncio
+import logging
+from datetime import datetime, timedelta, timezone
 from typing import Optional
 
 from app.models.streaming import WorkerInfo
 
+logger = logging.getLogger(__name__)
+
 # Global registry: identity → WorkerInfo
 # Follows the same pattern as app/services/storage.py
 WORKERS: dict[str, WorkerInfo] = {}
 
+# Secondary index: site_id → {identity → WorkerInfo}. Kept in step with WORKERS
+# so per-site listings don't scan the whole registry.
+_workers_by_site: dict[str, dict[str, WorkerInfo]] = {}
+
+# Workers silent for longer than this count as stale. Nothing runs the reaper yet:
+# the headset client registers once and never heartbeats, so it would drop live workers.
+STALE_AFTER = timedelta(minutes=5)
+REAP_INTERVAL_SEC = 60
+
+_UTC = timezone.utc
+
 
 def register_worker(
     identity: str,
@@ -18,7 +33,10 @@ def register_worker(
     room_name: str,
     feed_id: Optional[str] = None,
 ) -> WorkerInfo:
-    now = datetime.now(timezone.utc)
+    previous = WORKERS.get(identity)
+    if previous and previous.site_id != site_id:
+        _unindex(identity, previous.site_id)
+    now = datetime.now(_UTC)
     worker = WorkerInfo(
         identity=identity,
         display_name=display_name,
@@ -30,14 +48,14 @@ def register_worker(
         last_heartbeat=now,
     )
     WORKERS[identity] = worker
+    _workers_by_site.setdefault(site_id, {})[identity] = worker
     return worker
 
 
 def get_workers(site_id: Optional[str] = None) -> list[WorkerInfo]:
-    workers = list(WORKERS.values())
     if site_id:
-        workers = [w for w in workers if w.site_id == site_id]
-    return workers
+        return list(_workers_by_site.get(site_id, {}).values())
+    return list(WORKERS.values())
 
 
 def update_status(identity: str, status: str) -> Optional[WorkerInfo]:
@@ -45,7 +63,7 @@ def update_status(identity: str, status: str) -> Optional[WorkerInfo]:
     if not worker:
         return None
     worker.status = status
-    WORKERS[identity] = worker
+    worker.last_heartbeat = datetime.now(_UTC)
     return worker
 
 
@@ -53,6 +71,37 @@ def heartbeat(identity: str) -> Optional[WorkerInfo]:
     worker = WORKERS.get(identity)
     if not worker:
         return None
-    worker.last_heartbeat = datetime.now(timezone.utc)
-    WORKERS[identity] = worker
+    worker.last_heartbeat = datetime.now(_UTC)
     return worker
+
+
+def _unindex(identity: str, site_id: str) -> None:
+    site_workers = _workers_by_site.get(site_id)
+    if site_workers is not None:
+        site_workers.pop(identity, None)
+        if not site_workers:
+            del _workers_by_site[site_id]
+
+
+def _evict(identity: str) -> None:
+    worker = WORKERS.pop(identity, None)
+    if worker is not None:
+        _unindex(identity, worker.site_id)
+
+
+def evict_stale(max_age: timedelta = STALE_AFTER) -> list[str]:
+    """Drop workers whose last heartbeat is older than max_age. Returns evicted identities."""
+    cutoff = datetime.now(_UTC) - max_age
+    stale = [identity for identity, w in WORKERS.items() if w.last_heartbeat < cutoff]
+    for identity in stale:
+        _evict(identity)
+    return stale
+
+
+async def reap_stale(max_age: timedelta = STALE_AFTER, interval: float = REAP_INTERVAL_SEC) -> None:
+    """Background loop: evict stale workers every `interval` seconds. Runs until cancelled."""
+    while True:
+        await asyncio.sleep(interval)
+        evicted = evict_stale(max_age)
+        if evicted:
+            logger.info("Evicted %d stale worker(s): %s", len(evicted), ", ".join(evicted))
@@ -13,6 +13,9 @@ Usage:
 from __future__ import annotations
 
 import argparse
+import asyncio
+import functools
+import hashlib
 import os
 import subprocess
 import sys
@@ -89,8 +92,26 @@ def ensure_index(client, index_id: str | None):
 PEGASUS_MIN_DURATION_SEC = 4.0
 
 
-def get_video_duration_sec(path: Path) -> float | None:
-    """Return duration in seconds via ffprobe, or None if unavailable."""
+# (resolved path, mtime_ns, size) → duration; lets retries of the same file skip the probe
+_DURATION_CACHE: dict[tuple[str, int, int], float | None] = {}
+
+
+def _duration_via_av(path: Path) -> float | None:
+    """Read container duration in-process with PyAV (no subprocess). None if av is missing or fails."""
+    try:
+        import av
+    except ImportError:
+        return None
+    try:
+        with av.open(str(path)) as container:
+            if container.duration is None:
+                return None
+            return float(container.duration) / av.time_base
+    except Exception:
+        return None
+
+
+def _duration_via_ffprobe(path: Path) -> float | None:
     try:
         r = subprocess.run(
             [
@@ -108,31 +129,254 @@ def get_video_duration_sec(path: Path) -> float | None:
     return None
 
 
-def reencode_for_pegasus(video_path: Path) -> Path:
-    """Re-encode video to H.264 30fps main profile for Twelve Labs compatibility. Returns path to temp file."""
+def get_video_duration_sec(path: Path) -> float | None:
+    """Return duration in seconds via PyAV (ffprobe fallback), or None if unavailable."""
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    key = (str(path.resolve()), st.st_mtime_ns, st.st_size)
+    if key not in _DURATION_CACHE:
+        duration = _duration_via_av(path)
+        if duration is None:
+            duration = _duration_via_ffprobe(path)
+        _DURATION_CACHE[key] = duration
+    return _DURATION_CACHE[key]
+
+
+@functools.lru_cache(maxsize=1)
+def _has_nvenc() -> bool:
+    """Return True if the local ffmpeg build exposes the h264_nvenc encoder (checked once)."""
+    try:
+        r = subprocess.run(
+            ["ffmpeg", "-hide_banner", "-encoders"],
+            capture_output=True,
+            text=True,
+            timeout=10,
+        )
+    except Exception:
+        return False
+    return r.returncode == 0 and "h264_nvenc" in r.stdout
+
+
+# NVDEC decoders by source codec; anything else decodes via plain -hwaccel cuda (or on the CPU)
+_CUVID_DECODERS = {
+    "h264": "h264_cuvid",
+    "hevc": "hevc_cuvid",
+    "av1": "av1_cuvid",
+    "vp9": "vp9_cuvid",
+}
+
+
+def _probe_video_codec(video_path: Path) -> str | None:
+    """Return the first video stream's codec name (e.g. "h264"), or None if it can't be probed."""
+    try:
+        import av
+    except ImportError:
+        return None
+    try:
+        with av.open(str(video_path)) as container:
+            if not container.streams.video:
+                return None
+            return container.streams.video[0].codec_context.name
+    except Exception:
+        return None
+
+
+def _pegasus_encode_cmd(jobs: list[tuple[Path, Path]], nvenc: bool) -> list[str]:
+    """One ffmpeg command re-encoding every (input, output) pair to H.264 main / 30fps / AAC.
+
+    With several pairs each output maps the video (and audio, if any) of its own input,
+    so the whole batch shares a single process and encoder session.
+    """
+    cmd = ["ffmpeg", "-y", "-loglevel", "error"]
+    for src, _ in jobs:
+        if nvenc:
+            cmd += ["-hwaccel", "cuda", "-hwaccel_output_format", "cuda"]
+            decoder = _CUVID_DECODERS.get(_probe_video_codec(src) or "")
+            if decoder:
+                cmd += ["-c:v", decoder]
+        cmd += ["-i", str(src)]
+    if nvenc:
+        # Frames stay in GPU memory between decode and encode; NVENC emits 4:2:0 itself,
+        # so no -pix_fmt (a CPU-side conversion would force a download).
+        video_args = ["-c:v", "h264_nvenc", "-preset", "p4", "-profile:v", "main"]
+    else:
+        video_args = ["-c:v", "libx264", "-profile:v", "main", "-pix_fmt", "yuv420p"]
+    for i, (_, out) in enumerate(jobs):
+        if len(jobs) > 1:
+            cmd += ["-map", f"{i}:v:0", "-map", f"{i}:a:0?"]
+        cmd += [
+            *video_args, "-r", "30",
+            "-c:a", "aac", "-b:a", "128k", "-movflags", "+faststart",
+            str(out),
+        ]
+    return cmd
+
+
+# Set after the first failed NVENC run so later encodes go straight to libx264
+_nvenc_failed = False
+
+
+def _run_pegasus_encode(jobs: list[tuple[Path, Path]]) -> None:
+    """Run the re-encode with NVENC when available, falling back to libx264 if the GPU run fails
+    (e.g. the encoder is compiled in but no NVIDIA device is present)."""
+    global _nvenc_failed
+    r = None
+    if _has_nvenc() and not _nvenc_failed:
+        r = subprocess.run(
+            _pegasus_encode_cmd(jobs, nvenc=True),
+            stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True,
+        )
+        if r.returncode != 0:
+            _nvenc_failed = True
+            print("NVENC encode failed, falling back to libx264 for this session...")
+    if r is None or r.returncode != 0:
+        r = subprocess.run(
+            _pegasus_encode_cmd(jobs, nvenc=False),
+            stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True,
+        )
+    if r.returncode != 0 or not all(out.is_file() for _, out in jobs):
+        raise RuntimeError(f"ffmpeg failed: {r.stderr}")
+
+
+_PEGASUS_H264_PROFILES = frozenset({"Baseline", "Constrained Baseline", "Main", "High"})
+_PEGASUS_FPS = 30
+# ISO base-media brands of plain MP4 files; QuickTime ("qt  ") and 3GPP brands are re-encoded
+_MP4_BRANDS = frozenset({"isom", "iso2", "iso4", "iso5", "iso6", "mp41", "mp42", "avc1"})
+
+
+def _is_faststart(video_path: Path) -> bool:
+    """Return True if the top-level moov box precedes mdat (i.e. the file was written with +faststart)."""
+    try:
+        with open(video_path, "rb") as f:
+            while True:
+                header = f.read(8)
+                if len(header) < 8:
+                    return False
+                size = int.from_bytes(header[:4], "big")
+                box = header[4:]
+                if box == b"moov":
+                    return True
+                if box == b"mdat":
+                    return False
+                if size == 1:  # 64-bit largesize follows the type
+                    size = int.from_bytes(f.read(8), "big") - 8
+                elif size == 0:  # box runs to end of file
+                    return False
+                f.seek(size - 8, os.SEEK_CUR)
+    except OSError:
+        return False
+
+
+def _needs_reencode(video_path: Path) -> bool:
+    """Return False only when the file is already a faststart .mp4 / H.264 (baseline|main|high) / 30fps / AAC.
+
+    Anything that can't be probed (av missing, unreadable file) is treated as needing a re-encode.
+    """
+    if video_path.suffix.lower() != ".mp4" or not _is_faststart(video_path):
+        return True
+    try:
+        import av
+    except ImportError:
+        return True
+    try:
+        with av.open(str(video_path)) as container:
+            if container.metadata.get("major_brand", "").strip() not in _MP4_BRANDS:
+                return True
+            if not container.streams.video:
+                return True
+            stream = container.streams.video[0]
+            if stream.codec_context.name != "h264" or stream.profile not in _PEGASUS_H264_PROFILES:
+                return True
+            if stream.average_rate is None or round(float(stream.average_rate)) != _PEGASUS_FPS:
+                return True
+            return any(a.codec_context.name != "aac" for a in container.streams.audio)
+    except Exception:
+        return True
+
+
+def _pegasus_output_path(video_path: Path) -> Path:
+    # Same-stem inputs from different directories (e.g. chunk_0000.mp4) must not share an output
+    digest = hashlib.sha1(str(video_path.resolve()).encode()).hexdigest()[:8]
+    return Path(tempfile.gettempdir()) / f"pegasus_input_{video_path.stem}_{digest}.mp4"
+
+
+def reencode_for_pegasus(video_path: Path, force: bool = False) -> Path:
+    """Re-encode video to H.264 30fps main profile for Twelve Labs compatibility. Returns path to temp file.
+
+    Files that already match are returned as-is unless force=True.
+    """
     video_path = video_path.resolve()
     if not video_path.is_file():
         raise FileNotFoundError(f"Video not found: {video_path}")
-    out = Path(tempfile.gettempdir()) / f"pegasus_input_{video_path.stem}.mp4"
-    cmd = [
-        "ffmpeg", "-y", "-i", str(video_path),
-        "-c:v", "libx264", "-profile:v", "main", "-pix_fmt", "yuv420p", "-r", "30",
-        "-c:a", "aac", "-b:a", "128k", "-movflags", "+faststart",
-        str(out),
-    ]
+    if not force and not _needs_reencode(video_path):
+        print("Video is already H.264 30fps, skipping re-encode.")
+        return video_path
+    out = _pegasus_output_path(video_path)
     print("Re-encoding for API compatibility (30fps, H.264 main)...")
-    r = subprocess.run(cmd, capture_output=True, text=True)
-    if r.returncode != 0 or not out.is_file():
-        raise RuntimeError(f"ffmpeg failed: {r.stderr or r.stdout}")
+    _run_pegasus_encode([(video_path, out)])
     print(f"Re-encoded to {out}")
     return out
 
 
-def upload_and_wait(client, index_id: str, video_path: Path | None, video_url: str | None) -> str:
+def reencode_batch_for_pegasus(video_paths: list[Path], force: bool = False) -> list[Path]:
+    """Re-encode several videos in a single ffmpeg process. Returns paths in input order.
+
+    Amortizes process start-up and (with NVENC) encoder session creation across the batch.
+    Inputs that are already compatible are returned unchanged and left out of the batch,
+    unless force=True.
+    """
+    paths = [p.resolve() for p in video_paths]
+    for p in paths:
+        if not p.is_file():
+            raise FileNotFoundError(f"Video not found: {p}")
+    results = list(paths)
+    # Output names are unique per resolved path, so a repeated input is encoded once
+    pending: dict[Path, Path] = {}
+    for i, p in enumerate(paths):
+        if force or p in pending or _needs_reencode(p):
+            results[i] = pending.setdefault(p, _pegasus_output_path(p))
+    if not pending:
+        return results
+    print(f"Re-encoding {len(pending)} videos for API compatibility (30fps, H.264 main)...")
+    _run_pegasus_encode(list(pending.items()))
+    print(f"Re-encoded to {', '.join(str(out) for out in pending.values())}")
+    return results
+
+
+TASK_POLL_MAX_SLEEP_SEC = 30
+
+
+async def wait_for_ready(client, task_id: str):
+    """Poll an indexing task until it reaches a terminal status, with capped exponential back-off.
+
+    The SDK call runs in a worker thread so several uploads can be tracked concurrently.
+    """
+    attempt = 0
+    while True:
+        task = await asyncio.to_thread(client.tasks.retrieve, task_id)
+        print(f"  [{task_id}] Status={task.status}")
+        if task.status in ("ready", "failed"):
+            return task
+        await asyncio.sleep(min(TASK_POLL_MAX_SLEEP_SEC, 2 ** attempt))
+        attempt += 1
+
+
+def _create_file_task(client, index_id: str, video_path: Path):
+    # Pass (filename, file_handle, mime_type) so the SDK sends a proper multipart filename
+    with open(video_path, "rb") as f:
+        return client.tasks.create(
+            index_id=index_id,
+            video_file=(video_path.name, f, "video/mp4"),
+        )
+
+
+async def upload_and_wait(client, index_id: str, video_path: Path | None, video_url: str | None) -> str:
     """Upload video to index (from file or URL), wait for indexing, return video_id."""
     if video_url:
         print(f"Submitting video URL to index {index_id}...")
-        task = client.tasks.create(index_id=index_id, video_url=video_url)
+        task = await asyncio.to_thread(client.tasks.create, index_id=index_id, video_url=video_url)
     else:
         video_path = (video_path or Path()).resolve()
         if not video_path.is_file():
@@ -150,12 +394,7 @@ def upload_and_wait(client, index_id: str, video_path: Path | None, video_url: s
             sys.exit(1)
         print(f"Uploading {video_path} to index {index_id}...")
         try:
-            # Pass (filename, file_handle, mime_type) so the SDK sends a proper multipart filename
-            with open(video_path, "rb") as f:
-                task = client.tasks.create(
-                    index_id=index_id,
-                    video_file=(video_path.name, f, "video/mp4"),
-                )
+            task = await asyncio.to_thread(_create_file_task, client, index_id, video_path)
         except Exception as e:
             err_msg = str(e).lower()
             if "video_file_broken" in err_msg or "unable to process video" in err_msg:
@@ -168,11 +407,7 @@ def upload_and_wait(client, index_id: str, video_path: Path | None, video_url: s
                 )
             raise
     print(f"Task id={task.id}, waiting for indexing...")
-    task = client.tasks.wait_for_done(
-        task_id=task.id,
-        sleep_interval=5,
-        callback=lambda t: print(f"  Status={t.status}"),
-    )
+    task = await wait_for_ready(client, task.id)
     if task.status != "ready":
         print(f"Indexing failed with status {task.status}", file=sys.stderr)
         sys.exit(1)
@@ -180,6 +415,23 @@ def upload_and_wait(client, index_id: str, video_path: Path | None, video_url: s
     return task.video_id
 
 
+async def process_many(
+    client, index_id: str, video_paths: list[Path], max_concurrency: int = 16,
+) -> list[str]:
+    """Upload several local videos and wait for all of them concurrently. Returns video_ids in input order.
+
+    At most max_concurrency uploads/pollers are in flight at once, which bounds both the
+    worker threads in use and the request rate against the Twelve Labs API.
+    """
+    sem = asyncio.Semaphore(max_concurrency)
+
+    async def one(path: Path) -> str:
+        async with sem:
+            return await upload_and_wait(client, index_id, path, None)
+
+    return await asyncio.gather(*(one(p) for p in video_paths))
+
+
 def analyze_video(client, video_id: str, prompt: str) -> str:
     """Call Pegasus analyze (open-ended) and return generated text."""
     print("Calling Pegasus API (analyze)...")
@@ -228,13 +480,14 @@ def main() -> None:
 
     video_path = Path(args.video) if args.video else None
     if args.reencode and video_path:
-        video_path = reencode_for_pegasus(video_path)
+        # An explicit --reencode is the user's fix for 'video_file_broken'; never skip it
+        video_path = reencode_for_pegasus(video_path, force=True)
     output_path = Path(args.output)
     output_path.parent.mkdir(parents=True, exist_ok=True)
 
     client = get_client(args.api_key)
     index_id = ensure_index(client, args.index_id)
-    video_id = upload_and_wait(client, index_id, video_path, args.video_url)
+    video_id = asyncio.run(upload_and_wait(client, index_id, video_path, args.video_url))
     prompt = args.prompt or DEFAULT_PROMPT
     text = analyze_video(client, video_id, prompt)
 
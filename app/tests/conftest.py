@@ -0,0 +1,13 @@
+"""Shared fixtures for app tests."""
+from __future__ import annotations
+
+import pytest
+
+from app.agents.safety_agent import run_deterministic_checks
+from app.data.mock_video_results import MOCK_VIDEO_RESULT
+
+
+@pytest.fixture(scope="session")
+def violations():
+    """Run deterministic checks once per session, reuse across all test modules."""
+    return run_deterministic_checks(MOCK_VIDEO_RESULT)
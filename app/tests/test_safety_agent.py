@@ -10,7 +10,6 @@ from __future__ import annotations
 import pytest
 
 from app.agents.safety_agent import (
-    run_deterministic_checks,
     _compute_compliance,
     _compute_overall_risk,
 )
@@ -20,12 +19,6 @@ from app.models.alert import AlertSeverity
 
 # ── Fixtures ──────────────────────────────────────────────────────────────────
 
-@pytest.fixture(scope="module")
-def violations():
-    """Run deterministic checks once, reuse across all tests."""
-    return run_deterministic_checks(MOCK_VIDEO_RESULT)
-
-
 @pytest.fixture(scope="module")
 def compliance(violations):
     ppe, zone = _compute_compliance(MOCK_VIDEO_RESULT, violations)
@@ -0,0 +1,123 @@
+"""Unit tests for the in-memory worker registry and its site index.
+
+Run:
+    python -m pytest app/tests/test_worker_registry.py -v
+"""
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from app.services import worker_registry
+from app.services.worker_registry import (
+    evict_stale,
+    get_workers,
+    heartbeat,
+    register_worker,
+    update_status,
+)
+
+
+# ── Fixtures ──────────────────────────────────────────────────────────────────
+
+@pytest.fixture(autouse=True)
+def empty_registry():
+    """Each test starts from (and leaves behind) an empty registry."""
+    worker_registry.WORKERS.clear()
+    worker_registry._workers_by_site.clear()
+    yield
+    worker_registry.WORKERS.clear()
+    worker_registry._workers_by_site.clear()
+
+
+def _register(identity: str, site_id: str):
+    return register_worker(identity, identity.upper(), site_id, f"site-{site_id}")
+
+
+def _age(identity: str, minutes: float) -> None:
+    worker_registry.WORKERS[identity].last_heartbeat = (
+        datetime.now(timezone.utc) - timedelta(minutes=minutes)
+    )
+
+
+# ── Tests ─────────────────────────────────────────────────────────────────────
+
+class TestGetWorkers:
+    def test_filters_by_site(self):
+        _register("w1", "s1")
+        _register("w2", "s1")
+        _register("w3", "s2")
+        assert {w.identity for w in get_workers("s1")} == {"w1", "w2"}
+        assert [w.identity for w in get_workers("s2")] == ["w3"]
+
+    def test_unknown_site_is_empty(self):
+        _register("w1", "s1")
+        assert get_workers("nope") == []
+
+    def test_no_site_lists_everyone(self):
+        _register("w1", "s1")
+        _register("w2", "s2")
+        assert {w.identity for w in get_workers()} == {"w1", "w2"}
+
+
+class TestRegisterWorker:
+    def test_reregister_same_site_replaces_entry(self):
+        _register("w1", "s1")
+        _register("w1", "s1")
+        assert len(get_workers("s1")) == 1
+        assert len(get_workers()) == 1
+
+    def test_site_change_moves_worker_between_indexes(self):
+        _register("w1", "s1")
+        _register("w1", "s2")
+        assert get_workers("s1") == []
+        assert [w.identity for w in get_workers("s2")] == ["w1"]
+        # Emptied site buckets are dropped, not left behind
+        assert "s1" not in worker_registry._workers_by_site
+
+    def test_site_change_keeps_other_workers(self):
+        _register("w1", "s1")
+        _register("w2", "s1")
+        _register("w1", "s2")
+        assert [w.identity for w in get_workers("s1")] == ["w2"]
+
+
+class TestLiveness:
+    def test_update_status_refreshes_heartbeat(self):
+        _register("w1", "s1")
+        _age("w1", 10)
+        update_status("w1", "streaming")
+        assert evict_stale() == []
+        assert get_workers("s1")[0].status == "streaming"
+
+    def test_heartbeat_refreshes_heartbeat(self):
+        _register("w1", "s1")
+        _age("w1", 10)
+        heartbeat("w1")
+        assert evict_stale() == []
+
+
+class TestEvictStale:
+    def test_evicts_only_stale_workers(self):
+        _register("w1", "s1")
+        _register("w2", "s1")
+        _register("w3", "s2")
+        _age("w1", 10)
+        _age("w3", 10)
+        assert sorted(evict_stale()) == ["w1", "w3"]
+        assert [w.identity for w in get_workers()] == ["w2"]
+        assert [w.identity for w in get_workers("s1")] == ["w2"]
+        assert "s2" not in worker_registry._workers_by_site
+
+    def test_custom_max_age(self):
+        _register("w1", "s1")
+        _age("w1", 2)
+        assert evict_stale(timedelta(minutes=5)) == []
+        assert evict_stale(timedelta(minutes=1)) == ["w1"]
+
+    def test_evicted_worker_is_unknown(self):
+        _register("w1", "s1")
+        _age("w1", 10)
+        evict_stale()
+        assert update_status("w1", "online") is None
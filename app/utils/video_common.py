@@ -4,11 +4,12 @@ Shared video utilities and prompts.
 from __future__ import annotations
 
 import base64
+import functools
 import io
 import logging
 import os
-import subprocess
 import tempfile
+from typing import Iterator
 
 import av
 import numpy as np
@@ -47,62 +48,154 @@ COMBINE_PROMPT = (
 # ── Video utilities ───────────────────────────────────────────────────────────
 
 
-def split_video(video_path: str, chunk_seconds: float, output_dir: str | None = None) -> list[str]:
-    """Split a video into N-second chunks using ffmpeg CLI. Returns sorted chunk paths."""
+def _add_stream_like(output, template):
+    # PyAV >= 14 renamed add_stream(template=...) to add_stream_from_template
+    if hasattr(output, "add_stream_from_template"):
+        return output.add_stream_from_template(template)
+    return output.add_stream(template=template)
+
+
+def split_video_iter(
+    video_path: str, chunk_seconds: float, output_dir: str | None = None,
+) -> Iterator[tuple[str, float]]:
+    """Split a video into ~N-second chunks in-process, yielding (chunk_path, start_seconds) as each closes.
+
+    Packets are stream-copied (no re-encode) and cut at the first keyframe at or after each
+    chunk boundary, like ffmpeg's segment muxer. Only the video stream is kept. Each chunk is
+    yielded as soon as it is written, so callers can start work before the split finishes.
+    """
     tmpdir = output_dir or tempfile.mkdtemp(prefix="ironsite_chunks_")
     os.makedirs(tmpdir, exist_ok=True)
-    pattern = os.path.join(tmpdir, "chunk_%04d.mp4")
-
-    subprocess.run(
-        [
-            "ffmpeg", "-i", video_path,
-            "-f", "segment",
-            "-segment_time", str(chunk_seconds),
-            "-reset_timestamps", "1",
-            "-c", "copy",
-            "-y", pattern,
-        ],
-        capture_output=True,
-        check=True,
-    )
-
-    chunks = sorted(
-        os.path.join(tmpdir, f)
-        for f in os.listdir(tmpdir)
-        if f.endswith(".mp4")
-    )
+
+    with av.open(video_path) as src:
+        in_stream = src.streams.video[0]
+        time_base = in_stream.time_base
+        origin = in_stream.start_time or 0
+
+        out = out_stream = None
+        path = ""
+        seg_index = 0
+        seg_start = 0.0
+        dts_offset = 0
+        next_boundary = chunk_seconds
+        try:
+            for packet in src.demux(in_stream):
+                if packet.dts is None:  # demuxer flush packet
+                    continue
+                pts = packet.pts if packet.pts is not None else packet.dts
+                t = float((pts - origin) * time_base)
+
+                if out is None or (packet.is_keyframe and t >= next_boundary):
+                    if out is not None:
+                        out.close()
+                        yield path, seg_start
+                        seg_index += 1
+                    while next_boundary <= t:
+                        next_boundary += chunk_seconds
+                    path = os.path.join(tmpdir, f"chunk_{seg_index:04d}.mp4")
+                    out = av.open(path, mode="w")
+                    out_stream = _add_stream_like(out, in_stream)
+                    seg_start = t
+                    # Rebase on the first DTS so every chunk starts at 0 (as -reset_timestamps 1)
+                    dts_offset = packet.dts
+
+                packet.dts -= dts_offset
+                if packet.pts is not None:
+                    packet.pts -= dts_offset
+                packet.stream = out_stream
+                out.mux(packet)
+        finally:
+            if out is not None:
+                out.close()
+        if out is not None:
+            yield path, seg_start
+
+
+def split_video(video_path: str, chunk_seconds: float, output_dir: str | None = None) -> list[str]:
+    """Split a video into N-second chunks (stream copy, in-process). Returns sorted chunk paths."""
+    chunks = [path for path, _ in split_video_iter(video_path, chunk_seconds, output_dir)]
     logger.info("Split %s into %d chunks (%.0fs each)", video_path, len(chunks), chunk_seconds)
     return chunks
 
 
-def read_video(video_path: str, max_frames: int = 8) -> np.ndarray:
-    """Decode video and uniformly sample max_frames frames. Returns (N, H, W, 3) uint8."""
+def read_video(video_path: str, max_frames: int = 8, size: tuple[int, int] | None = None) -> np.ndarray:
+    """Decode video and uniformly sample max_frames frames. Returns (N, H, W, 3) uint8.
+
+    Sample timestamps are derived from stream metadata, so only the kept frames are
+    converted to RGB arrays. Pass size=(width, height) to downscale in libswscale.
+    """
     container = av.open(video_path)
-    frames = [f.to_ndarray(format="rgb24") for f in container.decode(video=0)]
-    container.close()
+    try:
+        stream = container.streams.video[0]
+        stream.thread_type = "AUTO"
+        reformat = {"format": "rgb24"}
+        if size:
+            reformat.update(width=size[0], height=size[1])
+
+        if stream.duration and stream.average_rate:
+            fps = float(stream.average_rate)
+            # Prefer the container's frame count; derive it from duration when it isn't stored
+            total = max(1, stream.frames or int(float(stream.duration * stream.time_base) * fps))
+            indices = np.linspace(0, total - 1, min(max_frames, total), dtype=int)
+            start = stream.start_time or 0
+            targets = [start + int(i / fps / stream.time_base) for i in indices]
+
+            frames = []
+            last = None
+            for frame in container.decode(stream):
+                last = frame
+                if frame.pts is None or frame.pts < targets[len(frames)]:
+                    continue
+                arr = frame.to_ndarray(**reformat)
+                # Several targets can land on the same frame when metadata overstates fps
+                while len(frames) < len(targets) and frame.pts >= targets[len(frames)]:
+                    frames.append(arr)
+                if len(frames) == len(targets):
+                    break
+            # Metadata duration can run slightly past the last decodable frame
+            if last is not None and len(frames) < len(targets):
+                arr = last.to_ndarray(**reformat)
+                frames.extend([arr] * (len(targets) - len(frames)))
+        else:
+            # No usable metadata — decode everything to count, convert only the sampled frames
+            decoded = list(container.decode(stream))
+            indices = np.linspace(0, len(decoded) - 1, min(max_frames, len(decoded)), dtype=int)
+            frames = [decoded[i].to_ndarray(**reformat) for i in indices] if decoded else []
+    finally:
+        container.close()
 
     if not frames:
         raise ValueError(f"No frames decoded from {video_path}")
-
-    total = len(frames)
-    indices = np.linspace(0, total - 1, min(max_frames, total), dtype=int)
-    return np.stack([frames[i] for i in indices])
+    return np.stack(frames)
 
 
 def grab_thumbnail(video_path: str) -> str:
-    """Return base64 JPEG of the mid-point frame."""
-    container = av.open(video_path)
-    frames = []
-    for frame in container.decode(video=0):
-        frames.append(frame)
-        if len(frames) > 2:
-            break
-    container.close()
+    """Return base64 JPEG of the keyframe at (or just before) the mid-point of the video.
 
-    if not frames:
+    Memoized per (path, mtime, size) — thumbnails are deterministic per file.
+    """
+    try:
+        st = os.stat(video_path)
+    except OSError:
+        return ""
+    return _thumbnail_cached(video_path, st.st_mtime_ns, st.st_size)
+
+
+@functools.lru_cache(maxsize=256)
+def _thumbnail_cached(video_path: str, mtime_ns: int, size: int) -> str:
+    with av.open(video_path) as container:
+        if not container.streams.video:
+            return ""
+        stream = container.streams.video[0]
+        if stream.duration:
+            # Seek lands on the preceding keyframe, so one decode yields a frame
+            container.seek((stream.start_time or 0) + stream.duration // 2, stream=stream)
+        frame = next(container.decode(stream), None)
+
+    if frame is None:
         return ""
 
-    img = frames[len(frames) // 2].to_image()
+    img = frame.to_image()
     buf = io.BytesIO()
     img.save(buf, format="JPEG", quality=75)
     return base64.b64encode(buf.getvalue()).decode()
@@ -1,25 +1,37 @@
 """WebSocket connection manager for live feeds, alerts, and comms."""
 from __future__ import annotations
+
+import asyncio
+import json
+
 from fastapi import WebSocket
 
 
 class ConnectionManager:
     def __init__(self):
-        self.active: dict[str, list[WebSocket]] = {}
+        self.active: dict[str, set[WebSocket]] = {}
 
     async def connect(self, channel: str, ws: WebSocket):
         await ws.accept()
-        self.active.setdefault(channel, []).append(ws)
+        self.active.setdefault(channel, set()).add(ws)
 
     def disconnect(self, channel: str, ws: WebSocket):
-        if channel in self.active:
-            self.active[channel] = [w for w in self.active[channel] if w != ws]
+        sockets = self.active.get(channel)
+        if sockets is not None:
+            sockets.discard(ws)
 
     async def broadcast(self, channel: str, data: dict):
-        for ws in self.active.get(channel, []):
-            try:
-                await ws.send_json(data)
-            except Exception:
+        sockets = tuple(self.active.get(channel, ()))
+        if not sockets:
+            return
+        # Serialize once (same encoding as WebSocket.send_json), then fan out concurrently.
+        # Sent as text frames so browser clients can JSON.parse(event.data) directly.
+        payload = json.dumps(data, separators=(",", ":"), ensure_ascii=False)
+        results = await asyncio.gather(
+            *(ws.send_text(payload) for ws in sockets), return_exceptions=True
+        )
+        for ws, result in zip(sockets, results):
+            if isinstance(result, Exception):
                 self.disconnect(channel, ws)
 
 
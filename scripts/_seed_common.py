@@ -0,0 +1,34 @@
+"""Helpers shared by the Supabase seed/verify scripts."""
+from __future__ import annotations
+
+from datetime import datetime, timezone
+from functools import lru_cache
+
+_UTC = timezone.utc
+
+
+@lru_cache(maxsize=1)
+def mock_safety_report():
+    """Deterministic SafetyReport for site s1 built from MOCK_VIDEO_RESULT (computed once).
+
+    The summary is left empty — callers fill it in with model_copy(update=...).
+    """
+    from app.agents.safety_agent import (
+        run_deterministic_checks,
+        _compute_compliance,
+        _compute_overall_risk,
+    )
+    from app.models.analysis import SafetyReport
+    from app.data.mock_video_results import MOCK_VIDEO_RESULT
+
+    violations = run_deterministic_checks(MOCK_VIDEO_RESULT)
+    ppe, zone = _compute_compliance(MOCK_VIDEO_RESULT, violations)
+    return SafetyReport(
+        site_id="s1",
+        violations=violations,
+        ppe_compliance=ppe,
+        zone_adherence=zone,
+        overall_risk=_compute_overall_risk(violations),
+        summary="",
+        generated_at=datetime.now(_UTC),
+    )
@@ -17,11 +17,13 @@ Usage:
 from __future__ import annotations
 
 import argparse
+import importlib.util
 import json
 import logging
 import os
 import shutil
 import sys
+from concurrent.futures import ThreadPoolExecutor
 
 import numpy as np
 import torch
@@ -47,27 +49,88 @@ logger = logging.getLogger(__name__)
 _processor = None
 _model = None
 
-
-def load_vlm(model_id: str):
-    """Load LLaVA-NeXT-Video once and cache globally."""
+QUANT_MODES = ("none", "int8", "nf4", "fp8")
+
+# Keep the vision encoder and projector in fp16 — only the language model is quantized
+_QUANT_SKIP_MODULES = ["vision_tower", "multi_modal_projector", "lm_head"]
+
+
+def _quantization_config(quant: str):
+    """Build the from_pretrained quantization_config for a --quant mode (None for fp16).
+
+    int8/nf4 need bitsandbytes installed on the instance; fp8 needs transformers>=4.49
+    and a Hopper/Ada GPU. Missing packages raise ImportError naming what to install.
+    """
+    if quant == "none":
+        return None
+    if quant in ("int8", "nf4"):
+        if importlib.util.find_spec("bitsandbytes") is None:
+            raise ImportError(f"--quant {quant} needs bitsandbytes: pip install bitsandbytes")
+        from transformers import BitsAndBytesConfig
+
+        if quant == "int8":
+            return BitsAndBytesConfig(load_in_8bit=True, llm_int8_skip_modules=_QUANT_SKIP_MODULES)
+        return BitsAndBytesConfig(
+            load_in_4bit=True,
+            bnb_4bit_quant_type="nf4",
+            bnb_4bit_compute_dtype=torch.float16,
+            llm_int8_skip_modules=_QUANT_SKIP_MODULES,
+        )
+    if quant == "fp8":
+        try:
+            from transformers import FineGrainedFP8Config
+        except ImportError:
+            raise ImportError(
+                "--quant fp8 needs transformers>=4.49 (FineGrainedFP8Config): "
+                "pip install -U 'transformers>=4.49'"
+            ) from None
+
+        return FineGrainedFP8Config(modules_to_not_convert=_QUANT_SKIP_MODULES)
+    raise ValueError(f"Unknown quant mode {quant!r}; expected one of {QUANT_MODES}")
+
+
+def load_vlm(model_id: str, quant: str = "none", static_cache: bool = False):
+    """Load LLaVA-NeXT-Video once and cache globally.
+
+    quant selects weight quantization for the language model (see QUANT_MODES); decode is
+    memory-bandwidth bound, so smaller weights translate directly into tokens/s.
+    static_cache switches generate to a fixed-size KV cache, which recent transformers
+    compiles into a CUDA-graph decode step. Only the first call's options take effect.
+    """
     global _processor, _model
     if _model is not None:
         return _processor, _model
 
-    logger.info("Loading VLM: %s", model_id)
+    logger.info("Loading VLM: %s (quant=%s)", model_id, quant)
     _processor = LlavaNextVideoProcessor.from_pretrained(model_id)
+    quantization_config = _quantization_config(quant)
     _model = LlavaNextVideoForConditionalGeneration.from_pretrained(
         model_id,
         torch_dtype=torch.float16,
         device_map="auto",
+        **({"quantization_config": quantization_config} if quantization_config else {}),
     )
     _model.eval()
+    if static_cache:
+        _model.generation_config.cache_implementation = "static"
     logger.info("VLM loaded successfully on %s", next(_model.parameters()).device)
     return _processor, _model
 
 
 # ── Inference ─────────────────────────────────────────────────────────────────
 
+STATIC_PAD_MULTIPLE = 64
+
+
+def _chat_prompt(processor, text_prompt: str, with_video: bool) -> str:
+    content: list[dict] = []
+    if with_video:
+        content.append({"type": "video"})
+    content.append({"type": "text", "text": text_prompt})
+
+    conversation = [{"role": "user", "content": content}]
+    return processor.apply_chat_template(conversation, add_generation_prompt=True)
+
 
 def run_inference(
     text_prompt: str,
@@ -77,16 +140,14 @@ def run_inference(
 ) -> str:
     """Run LLaVA-NeXT-Video inference. Pass clip for video+text, omit for text-only."""
     processor, model = load_vlm(model_id)
-
-    content: list[dict] = []
-    if clip is not None:
-        content.append({"type": "video"})
-    content.append({"type": "text", "text": text_prompt})
-
-    conversation = [{"role": "user", "content": content}]
-    prompt = processor.apply_chat_template(conversation, add_generation_prompt=True)
+    prompt = _chat_prompt(processor, text_prompt, with_video=clip is not None)
 
     processor_kwargs = {"videos": clip} if clip is not None else {}
+    if model.generation_config.cache_implementation == "static":
+        # Round prompt lengths up so the compiled decode graph sees a handful of shapes,
+        # not one per distinct prompt length
+        processor.tokenizer.padding_side = "left"
+        processor_kwargs.update(padding=True, pad_to_multiple_of=STATIC_PAD_MULTIPLE)
     inputs = processor(prompt, **processor_kwargs, return_tensors="pt").to(model.device)
 
     with torch.no_grad():
@@ -96,16 +157,58 @@ def run_inference(
     return processor.decode(generated, skip_special_tokens=True).strip()
 
 
+def run_inference_batch(
+    text_prompts: list[str],
+    model_id: str,
+    clips: list[np.ndarray],
+    max_new_tokens: int = 512,
+) -> list[str]:
+    """Run video+text inference for several independent clips in a single generate call."""
+    processor, model = load_vlm(model_id)
+    # Left-pad so every row's prompt ends at the same column and generation starts together
+    processor.tokenizer.padding_side = "left"
+    prompts = [_chat_prompt(processor, p, with_video=True) for p in text_prompts]
+    pad_kwargs = {}
+    if model.generation_config.cache_implementation == "static":
+        pad_kwargs["pad_to_multiple_of"] = STATIC_PAD_MULTIPLE
+    inputs = processor(
+        text=prompts, videos=clips, padding=True, return_tensors="pt", **pad_kwargs,
+    ).to(model.device)
+
+    with torch.no_grad():
+        output_ids = model.generate(**inputs, max_new_tokens=max_new_tokens)
+
+    prompt_len = inputs["input_ids"].shape[-1]
+    return [
+        processor.decode(row[prompt_len:], skip_special_tokens=True).strip()
+        for row in output_ids
+    ]
+
+
 # ── Main pipeline ─────────────────────────────────────────────────────────────
 
 
+def _read_clips(paths: list[str], max_frames: int) -> list[np.ndarray]:
+    return [read_video(p, max_frames=max_frames) for p in paths]
+
+
+def _grab_thumbnails(paths: list[str]) -> list[str]:
+    return [grab_thumbnail(p) for p in paths]
+
+
 def process_video(
     video_path: str,
     model_id: str,
     chunk_seconds: float,
     max_frames: int,
+    temporal: bool = True,
+    batch_size: int = 4,
 ) -> dict:
-    """Full inference pipeline: split -> analyze chunks -> combine -> return JSON-serializable dict."""
+    """Full inference pipeline: split -> analyze chunks -> combine -> return JSON-serializable dict.
+
+    With temporal=True each chunk prompt includes the previous chunk's summary, so chunks run
+    one at a time. With temporal=False chunks are independent and run batch_size per generate.
+    """
     chunks = split_video(video_path, chunk_seconds)
     if not chunks:
         return {"chunk_summaries": [], "combined_briefing": "", "thumbnails": {}, "model": model_id}
@@ -114,20 +217,44 @@ def process_video(
     thumbnails: dict[str, str] = {}
     previous_summary: str | None = None
 
-    for idx, chunk_path in enumerate(chunks):
-        clip = read_video(chunk_path, max_frames=max_frames)
-
-        if previous_summary:
-            prompt = TEMPORAL_PROMPT_PREFIX.format(previous=previous_summary) + ZONE_PROMPT
+    # Decode the next chunk (and thumbnails) on worker threads while the GPU runs generate;
+    # PyAV spends its time in C with the GIL released, so decode and inference overlap.
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        if temporal:
+            next_clip = pool.submit(read_video, chunks[0], max_frames)
+            for idx, chunk_path in enumerate(chunks):
+                clip = next_clip.result()
+                thumb = pool.submit(grab_thumbnail, chunk_path)
+                if idx + 1 < len(chunks):
+                    next_clip = pool.submit(read_video, chunks[idx + 1], max_frames)
+
+                if previous_summary:
+                    prompt = TEMPORAL_PROMPT_PREFIX.format(previous=previous_summary) + ZONE_PROMPT
+                else:
+                    prompt = ZONE_PROMPT
+
+                summary = run_inference(prompt, model_id, clip=clip, max_new_tokens=512)
+                logger.info("Chunk %d/%d analyzed (%d chars)", idx + 1, len(chunks), len(summary))
+
+                chunk_summaries.append(summary)
+                thumbnails[f"chunk_{idx:04d}"] = thumb.result()
+                previous_summary = summary
         else:
-            prompt = ZONE_PROMPT
-
-        summary = run_inference(prompt, model_id, clip=clip, max_new_tokens=512)
-        logger.info("Chunk %d/%d analyzed (%d chars)", idx + 1, len(chunks), len(summary))
-
-        chunk_summaries.append(summary)
-        thumbnails[f"chunk_{idx:04d}"] = grab_thumbnail(chunk_path)
-        previous_summary = summary
+            batches = [chunks[i:i + batch_size] for i in range(0, len(chunks), batch_size)]
+            next_clips = pool.submit(_read_clips, batches[0], max_frames)
+            start = 0
+            for b, batch in enumerate(batches):
+                clips = next_clips.result()
+                thumbs = pool.submit(_grab_thumbnails, batch)
+                if b + 1 < len(batches):
+                    next_clips = pool.submit(_read_clips, batches[b + 1], max_frames)
+
+                summaries = run_inference_batch([ZONE_PROMPT] * len(batch), model_id, clips, max_new_tokens=512)
+                for idx, (summary, thumb) in enumerate(zip(summaries, thumbs.result()), start=start):
+                    logger.info("Chunk %d/%d analyzed (%d chars)", idx + 1, len(chunks), len(summary))
+                    chunk_summaries.append(summary)
+                    thumbnails[f"chunk_{idx:04d}"] = thumb
+                start += len(batch)
 
     # Combine all chunk summaries into a site-level briefing
     numbered = "\n\n".join(
@@ -157,17 +284,38 @@ def main():
     parser.add_argument("--chunk-seconds", type=float, default=5.0, help="Chunk duration in seconds")
     parser.add_argument("--max-frames", type=int, default=8, help="Max frames to sample per chunk")
     parser.add_argument("--output", required=True, help="Path to write result JSON")
+    parser.add_argument(
+        "--quant", choices=QUANT_MODES, default="none",
+        help="Quantize the language model weights (int8/nf4 need bitsandbytes; fp8 needs Ada/Hopper)",
+    )
+    parser.add_argument(
+        "--static-cache", action="store_true",
+        help="Use a static KV cache so generate can replay a compiled (CUDA graph) decode step",
+    )
+    parser.add_argument(
+        "--no-temporal", action="store_true",
+        help="Analyze chunks independently (no previous-summary context) so they can be batched",
+    )
+    parser.add_argument("--batch-size", type=int, default=4, help="Chunks per generate call with --no-temporal")
     args = parser.parse_args()
 
     if not os.path.isfile(args.video):
         logger.error("Video file not found: %s", args.video)
         sys.exit(1)
 
+    try:
+        load_vlm(args.model_id, quant=args.quant, static_cache=args.static_cache)
+    except ImportError as exc:
+        logger.error("%s", exc)
+        sys.exit(1)
+
     result = process_video(
         video_path=args.video,
         model_id=args.model_id,
         chunk_seconds=args.chunk_seconds,
         max_frames=args.max_frames,
+        temporal=not args.no_temporal,
+        batch_size=args.batch_size,
     )
 
     with open(args.output, "w") as f:
@@ -3,87 +3,136 @@
 Idempotent — uses upsert so it can be re-run safely.
 
 Usage:
-    python scripts/seed_supabase.py
+    python scripts/seed_supabase.py [--skip-safety]
 """
 from __future__ import annotations
 
+import argparse
 import sys
 import os
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from typing import Any
 
 # Allow running from repo root
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from supabase import create_client
+from pydantic import TypeAdapter
 
 from app.config import SUPABASE_URL, SUPABASE_KEY
+from app.models.alert import Alert
+from app.models.site import Site
+from app.models.streaming import FeedConfig
+from app.models.video import VideoProcessingResult
 from app.services.storage import SITES, ALERTS, BRIEFINGS, FEEDS, VIDEO_RESULTS
 
+# Dump each collection through one compiled list schema rather than per-instance model_dump
+_SITES_ADAPTER = TypeAdapter(list[Site])
+_ALERTS_ADAPTER = TypeAdapter(list[Alert])
+_FEEDS_ADAPTER = TypeAdapter(list[FeedConfig])
+_VIDEO_RESULTS_ADAPTER = TypeAdapter(list[VideoProcessingResult])
+_METADATA_ADAPTER = TypeAdapter(list[dict[str, Any]])
+
+_UTC = timezone.utc
+
+UPSERT_CHUNK_ROWS = 500
+
+
+def _upsert(sb, table: str, rows: list[dict], on_conflict: str) -> None:
+    """Upsert rows in one request per UPSERT_CHUNK_ROWS slice instead of one per row."""
+    for i in range(0, len(rows), UPSERT_CHUNK_ROWS):
+        sb.table(table).upsert(rows[i:i + UPSERT_CHUNK_ROWS], on_conflict=on_conflict).execute()
+
 
 def main() -> None:
+    parser = argparse.ArgumentParser(description="Push mock seed data into Supabase tables")
+    parser.add_argument(
+        "--skip-safety", action="store_true",
+        help="Skip computing and upserting the pre-seeded safety report",
+    )
+    args = parser.parse_args()
+
     if not SUPABASE_URL or not SUPABASE_KEY:
         print("ERROR: Set SUPABASE_URL and SUPABASE_KEY env vars (or in .env)")
         sys.exit(1)
 
+    # Imported here so --help and the missing-credentials path skip the supabase client stack
+    from supabase import create_client
+
     sb = create_client(SUPABASE_URL, SUPABASE_KEY)
 
     # ── Sites ─────────────────────────────────────────────────────────────────
+    # Sites go first (other tables key on site_id); the rest are independent and run concurrently
     print(f"Upserting {len(SITES)} sites...")
-    for site in SITES.values():
-        row = site.model_dump(mode="json")
-        # zones stored as JSONB column
-        sb.table("sites").upsert(row, on_conflict="id").execute()
-
-    # ── Alerts ────────────────────────────────────────────────────────────────
-    print(f"Upserting {len(ALERTS)} alerts...")
-    for alert in ALERTS.values():
-        row = alert.model_dump(mode="json")
-        sb.table("alerts").upsert(row, on_conflict="id").execute()
-
-    # ── Briefings ─────────────────────────────────────────────────────────────
-    print(f"Upserting {len(BRIEFINGS)} briefings...")
-    for site_id, text in BRIEFINGS.items():
-        sb.table("briefings").upsert(
-            {"site_id": site_id, "text": text}, on_conflict="site_id"
-        ).execute()
-
-    # ── Feeds ─────────────────────────────────────────────────────────────────
-    print(f"Upserting {len(FEEDS)} feeds...")
-    for feed in FEEDS.values():
-        row = feed.model_dump(mode="json")
-        sb.table("feeds").upsert(row, on_conflict="id").execute()
-
-    # ── Video results ─────────────────────────────────────────────────────────
-    print(f"Upserting {len(VIDEO_RESULTS)} video results...")
-    for vr in VIDEO_RESULTS.values():
-        sb.table("video_results").upsert(
-            {
-                "job_id": vr.job_id,
-                "site_id": vr.site_id,
-                "data": vr.model_dump(mode="json"),
-            },
-            on_conflict="job_id",
-        ).execute()
-
-    # ── Safety report (pre-computed from mock data) ───────────────────────────
-    _seed_safety_report(sb)
+    # zones stored as JSONB column
+    _upsert(sb, "sites", _SITES_ADAPTER.dump_python(list(SITES.values()), mode="json"), "id")
+
+    with ThreadPoolExecutor(max_workers=5) as pool:
+        pending = []
+
+        # ── Alerts ────────────────────────────────────────────────────────────
+        print(f"Upserting {len(ALERTS)} alerts...")
+        pending.append(pool.submit(
+            _upsert, sb, "alerts", _ALERTS_ADAPTER.dump_python(list(ALERTS.values()), mode="json"), "id",
+        ))
+
+        # ── Briefings ─────────────────────────────────────────────────────────
+        print(f"Upserting {len(BRIEFINGS)} briefings...")
+        pending.append(pool.submit(
+            _upsert, sb, "briefings",
+            [{"site_id": site_id, "text": text} for site_id, text in BRIEFINGS.items()],
+            "site_id",
+        ))
+
+        # ── Feeds ─────────────────────────────────────────────────────────────
+        print(f"Upserting {len(FEEDS)} feeds...")
+        pending.append(pool.submit(
+            _upsert, sb, "feeds", _FEEDS_ADAPTER.dump_python(list(FEEDS.values()), mode="json"), "id",
+        ))
+
+        # ── Video results ─────────────────────────────────────────────────────
+        print(f"Upserting {len(VIDEO_RESULTS)} video results...")
+        video_results = list(VIDEO_RESULTS.values())
+        # Every Optional model field defaults to None, so dropping the Nones from the JSONB
+        # blob round-trips to the same model. metadata is a free-form dict whose None values
+        # are real data, so it is dumped separately and kept verbatim.
+        video_data = _VIDEO_RESULTS_ADAPTER.dump_python(
+            video_results, mode="json", exclude_none=True, exclude={"__all__": {"metadata"}},
+        )
+        metadata = _METADATA_ADAPTER.dump_python([vr.metadata for vr in video_results], mode="json")
+        for data, meta in zip(video_data, metadata):
+            data["metadata"] = meta
+        pending.append(pool.submit(
+            _upsert, sb, "video_results",
+            [
+                {
+                    "job_id": vr.job_id,
+                    "site_id": vr.site_id,
+                    "data": data,
+                }
+                for vr, data in zip(video_results, video_data)
+            ],
+            "job_id",
+        ))
+
+        # ── Safety report (pre-computed from mock data) ───────────────────────
+        if not args.skip_safety:
+            pending.append(pool.submit(_seed_safety_report, sb))
+
+        # Surface the first failed upsert, as the sequential version did
+        for future in pending:
+            future.result()
 
     print("Done! All seed data upserted.")
 
 
 def _seed_safety_report(sb) -> None:
     """Compute and upsert the Safety Agent report for site s1."""
-    from datetime import datetime, timezone
-    from app.agents.safety_agent import (
-        run_deterministic_checks,
-        _compute_compliance,
-        _compute_overall_risk,
-    )
-    from app.models.analysis import SafetyReport
-    from app.data.mock_video_results import MOCK_VIDEO_RESULT
+    from _seed_common import mock_safety_report
 
-    violations = run_deterministic_checks(MOCK_VIDEO_RESULT)
-    ppe, zone = _compute_compliance(MOCK_VIDEO_RESULT, violations)
-    risk = _compute_overall_risk(violations)
+    now_ts = datetime.now(_UTC)
+    base = mock_safety_report()
+    violations, risk = base.violations, base.overall_risk
     summary = (
         f"[Pre-seeded] {len(violations)} safety violations detected across Riverside Tower. "
         f"Overall risk: {risk}. Top concerns: Zone B scaffold congestion (3 trades, 400 sqft), "
@@ -91,20 +140,12 @@ def _seed_safety_report(sb) -> None:
         f"Zone E live electrical work without LOTO and hot work without fire watch. "
         f"Run backend analysis to generate a full LLM-written executive summary."
     )
-    report = SafetyReport(
-        site_id="s1",
-        violations=violations,
-        ppe_compliance=ppe,
-        zone_adherence=zone,
-        overall_risk=risk,
-        summary=summary,
-        generated_at=datetime.now(timezone.utc),
-    )
+    report = base.model_copy(update={"summary": summary, "generated_at": now_ts})
     print(f"Upserting safety report for s1 ({len(violations)} violations, risk={risk})...")
     sb.table("safety_reports").upsert(
         {
             "site_id": "s1",
-            "generated_at": report.generated_at.isoformat(),
+            "generated_at": now_ts.isoformat(),
             "data": report.model_dump(mode="json"),
         },
         on_conflict="site_id",
@@ -9,8 +9,10 @@ If Supabase isn't seeded yet, run:
 """
 from __future__ import annotations
 
+import asyncio
 import sys
 import os
+from datetime import datetime, timezone
 
 # Allow running from repo root
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -18,12 +20,16 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from app.config import SUPABASE_URL, SUPABASE_KEY
 
 
+_UTC = timezone.utc
+_HIGH_SEVERITY = frozenset({"high", "AlertSeverity.high"})
+
+
 def _separator(msg: str, ok: bool = True) -> None:
     icon = "✓" if ok else "✗"
     print(f"  {icon}  {msg}")
 
 
-def check_supabase_fetch() -> bool:
+async def check_supabase_fetch() -> bool:
     """Try fetching mock_vj_001 video result from Supabase and run rule checks."""
     from app.agents.safety_agent import run_deterministic_checks
     from app.models.video import VideoProcessingResult
@@ -41,8 +47,11 @@ def check_supabase_fetch() -> bool:
             _separator(f"Failed to connect: {exc}", ok=False)
             return False
 
-        rows = sb.table("video_results").select("*").eq("job_id", "mock_vj_001").execute().data
-        if not rows:
+        # Only the JSONB blob is needed; maybe_single() returns None instead of raising on no match
+        row = await asyncio.to_thread(
+            lambda: sb.table("video_results").select("data").eq("job_id", "mock_vj_001").maybe_single().execute()
+        )
+        if row is None:
             _separator(
                 "No row found for mock_vj_001. Run: python scripts/seed_supabase.py",
                 ok=False,
@@ -51,7 +60,7 @@ def check_supabase_fetch() -> bool:
 
         _separator("Fetched video_results row for mock_vj_001")
         try:
-            result = VideoProcessingResult(**rows[0]["data"])
+            result = VideoProcessingResult.model_validate(row.data["data"])
         except Exception as exc:
             _separator(f"Deserialization failed: {exc}", ok=False)
             return False
@@ -87,11 +96,14 @@ def check_supabase_fetch() -> bool:
         _separator(f"Expected ≥ 20 violations, got {vcount}", ok=False)
         return False
 
-    high_count = sum(1 for v in violations if str(v.severity) in ("high", "AlertSeverity.high"))
-    print(f"\n  Violation breakdown:")
     from collections import Counter
-    types = Counter(v.type for v in violations)
-    for t, c in sorted(types.items(), key=lambda x: -x[1]):
+    types: Counter[str] = Counter()
+    high_count = 0
+    for v in violations:
+        types[v.type] += 1
+        high_count += str(v.severity) in _HIGH_SEVERITY
+    print(f"\n  Violation breakdown:")
+    for t, c in types.most_common():
         print(f"    {t:25s} × {c}")
 
     print(f"\n  High-severity: {high_count} / {vcount} total")
@@ -99,35 +111,18 @@ def check_supabase_fetch() -> bool:
     return True
 
 
-def check_safety_report_save() -> bool:
+async def check_safety_report_save() -> bool:
     """Verify that save_safety_report writes back to Supabase (or in-memory)."""
-    import asyncio
     from app.services import db
-    from app.data.mock_video_results import MOCK_VIDEO_RESULT
-    from app.agents.safety_agent import run_deterministic_checks, _compute_compliance, _compute_overall_risk
-    from app.models.analysis import SafetyReport
-    from datetime import datetime, timezone
-
-    violations = run_deterministic_checks(MOCK_VIDEO_RESULT)
-    ppe, zone = _compute_compliance(MOCK_VIDEO_RESULT, violations)
-    risk = _compute_overall_risk(violations)
-
-    report = SafetyReport(
-        site_id="s1",
-        violations=violations,
-        ppe_compliance=ppe,
-        zone_adherence=zone,
-        overall_risk=risk,
-        summary="[verify_supabase_fetch.py] Test save — not from LLM.",
-        generated_at=datetime.now(timezone.utc),
-    )
-
-    async def _save():
-        await db.save_safety_report("s1", report)
-        fetched = await db.get_safety_report("s1")
-        return fetched
-
-    fetched = asyncio.run(_save())
+    from _seed_common import mock_safety_report
+
+    report = mock_safety_report().model_copy(update={
+        "summary": "[verify_supabase_fetch.py] Test save — not from LLM.",
+        "generated_at": datetime.now(_UTC),
+    })
+
+    await db.save_safety_report("s1", report)
+    fetched = await db.get_safety_report("s1")
     if fetched is None:
         _separator("save/fetch safety report: got None back", ok=False)
         return False
@@ -136,14 +131,20 @@ def check_safety_report_save() -> bool:
     return True
 
 
+async def _run_checks() -> tuple[bool, bool]:
+    # Run in order on one event loop so each step's report prints as a block
+    step1 = await check_supabase_fetch()
+    print()
+    step2 = await check_safety_report_save()
+    return step1, step2
+
+
 def main() -> None:
     print("=" * 60)
     print("  IronMiner — Safety Agent Supabase Fetch Verification")
     print("=" * 60)
 
-    step1 = check_supabase_fetch()
-    print()
-    step2 = check_safety_report_save()
+    step1, step2 = asyncio.run(_run_checks())
 
     print("\n" + "=" * 60)
     if step1 and step2: